@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Iterable, List
 
 try:  # pragma: no cover - optional dependency
@@ -14,6 +15,7 @@ except ModuleNotFoundError:  # pragma: no cover - optional dependency
         return False
 
 
+@lru_cache(maxsize=None)
 def _load_environment() -> None:
     """Load configuration variables from a ``.env`` file if available."""
 
@@ -22,11 +24,24 @@ def _load_environment() -> None:
 
 _load_environment()
 
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read an integer setting, using ``default`` when it is unset or not a number."""
+
+    try:
+        value = int(os.getenv(name) or default)
+    except ValueError:
+        return default
+    return max(value, minimum)
+
+
 OPENAI_API_KEY: str | None = os.getenv("OPENAI_API_KEY")
 SPREADSHEET_ID: str | None = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID")
 CALENDAR_ID: str = os.getenv("GOOGLE_CALENDAR_ID", "primary")
 SIMPLIFY_API_KEY: str | None = os.getenv("SIMPLIFY_API_KEY")
-SIMPLIFY_BASE: str = os.getenv("SIMPLIFY_BASE", "https://api.simplify.jobs")
+SIMPLIFY_BASE: str = os.getenv("SIMPLIFY_BASE", "https://api.simplify.jobs").rstrip("/")
+SHEETS_FLUSH_THRESHOLD: int = _env_int("SHEETS_FLUSH", 100)
+TRACKER_FORCE_SHEET_CHECK: bool = os.getenv("TRACKER_FORCE_SHEET_CHECK", "").lower() in {"1", "true", "yes"}
 
 
 def _parse_feeds(raw_value: str) -> List[str]:
@@ -43,5 +58,7 @@ __all__: Iterable[str] = (
     "CALENDAR_ID",
     "SIMPLIFY_API_KEY",
     "SIMPLIFY_BASE",
+    "SHEETS_FLUSH_THRESHOLD",
+    "TRACKER_FORCE_SHEET_CHECK",
     "RSS_FEEDS",
 )
@@ -7,6 +7,17 @@ from typing import List
 
 from .llm import LLM
 
+# Dedented once at import; only the variable fields are filled in per call
+_COVER_TEMPLATE = dedent(
+    """
+    Write a 250-300 word cover letter for {role} at {company}.
+    Weave in these highlights: {highlights}.
+    Mirror the language of this job description:
+    {job_desc}
+    Keep tone: enthusiastic, concrete, professional. No fluff.
+    """
+)
+
 
 def cover_letter_draft(
     llm: LLM,
@@ -17,13 +28,18 @@ def cover_letter_draft(
 ) -> str:
     """Ask the configured language model to create a cover letter draft."""
 
-    prompt = dedent(
-        f"""
-        Write a 250-300 word cover letter for {role} at {company}.
-        Weave in these highlights: {highlights}.
-        Mirror the language of this job description:
-        {job_desc}
-        Keep tone: enthusiastic, concrete, professional. No fluff.
-        """
-    )
+    prompt = _COVER_TEMPLATE.format(role=role, company=company, highlights=highlights, job_desc=job_desc)
     return llm.complete(prompt)
+
+
+async def cover_letter_draft_async(
+    llm: LLM,
+    company: str,
+    role: str,
+    job_desc: str,
+    highlights: List[str],
+) -> str:
+    """Async variant of :func:`cover_letter_draft` built on ``LLM.acomplete``."""
+
+    prompt = _COVER_TEMPLATE.format(role=role, company=company, highlights=highlights, job_desc=job_desc)
+    return await llm.acomplete(prompt)
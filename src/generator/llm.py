@@ -2,24 +2,37 @@
 
 from __future__ import annotations
 
-import os
 from typing import Literal
 
+from src.config import OPENAI_API_KEY
+
 Model = Literal["gpt-4o-mini", "gpt-4.1", "gpt-4o"]
 
+# Longest prompt echoed back by the local stub
+MAX_PROMPT_CHARS = 4000
+
 
 class LLM:
     """Simple facade around an LLM provider."""
 
     def __init__(self, api_key: str | None = None, model: Model = "gpt-4o-mini") -> None:
-        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.api_key = api_key or OPENAI_API_KEY
         self.model = model
 
     def complete(self, prompt: str) -> str:
         """Return a completion for the supplied prompt."""
 
-        # For local testing, return echo
-        return f"[DRAFT]\n{prompt[:4000]}"
+        # For local testing, return echo; only slice when the prompt is actually too long
+        body = prompt if len(prompt) <= MAX_PROMPT_CHARS else prompt[:MAX_PROMPT_CHARS]
+        return "[DRAFT]\n" + body
+
+    async def acomplete(self, prompt: str) -> str:
+        """Asynchronously return a completion so many prompts can be in flight at once."""
+
+        import asyncio
+
+        # ``complete`` is blocking (as a provider SDK call would be), so keep it off the event loop
+        return await asyncio.to_thread(self.complete, prompt)
 
 
 __all__ = ["LLM", "Model"]
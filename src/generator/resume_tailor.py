@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from textwrap import dedent
 from typing import List
 
@@ -12,6 +13,38 @@ SYSTEM_PROMPT = (
     "Optimize for ATS keywords and clarity."
 )
 
+# Dedented once at import; only the variable fields are filled in per call
+_PROMPT_TEMPLATE = dedent(
+    """
+    System: {system_prompt}
+
+    Role: {job_title}
+    Job Description:
+    {job_desc}
+
+    Base bullets:
+    - {bullets_section}
+
+    Rewrite 4-5 bullets that best match the role. Keep each bullet under 25 words.
+    Use strong verbs and quantify impact.
+    """
+)
+
+# A "-" bullet line; surrounding dashes/whitespace are trimmed like ``str.strip("- ")``
+_BULLET_RE = re.compile(r"^[ \t]*-[- \t]*(.*?)[- \t\r]*$", re.MULTILINE)
+
+
+def _build_prompt(job_title: str, job_desc: str, base_bullets: List[str]) -> str:
+    """Fill the tailoring prompt template for a single posting."""
+
+    bullets_section = "\n- ".join(base_bullets) if base_bullets else ""
+    return _PROMPT_TEMPLATE.format(
+        system_prompt=SYSTEM_PROMPT,
+        job_title=job_title,
+        job_desc=job_desc,
+        bullets_section=bullets_section,
+    )
+
 
 def tailor_resume_bullets(
     llm: LLM,
@@ -21,24 +54,20 @@ def tailor_resume_bullets(
 ) -> List[str]:
     """Generate refined resume bullets tailored to a job description."""
 
-    bullets_section = "\n    - ".join(base_bullets) if base_bullets else ""
-    prompt = dedent(
-        f"""
-        System: {SYSTEM_PROMPT}
+    output = llm.complete(_build_prompt(job_title, job_desc, base_bullets))
+    return _BULLET_RE.findall(output)
 
-        Role: {job_title}
-        Job Description:
-        {job_desc}
 
-        Base bullets:
-        - {bullets_section}
+async def tailor_resume_bullets_async(
+    llm: LLM,
+    job_title: str,
+    job_desc: str,
+    base_bullets: List[str],
+) -> List[str]:
+    """Async variant of :func:`tailor_resume_bullets` built on ``LLM.acomplete``."""
 
-        Rewrite 4-5 bullets that best match the role. Keep each bullet under 25 words.
-        Use strong verbs and quantify impact.
-        """
-    )
-    output = llm.complete(prompt)
-    return [line.strip("- ") for line in output.splitlines() if line.strip().startswith("-")]
+    output = await llm.acomplete(_build_prompt(job_title, job_desc, base_bullets))
+    return _BULLET_RE.findall(output)
 
 
-__all__ = ["tailor_resume_bullets", "SYSTEM_PROMPT"]
+__all__ = ["tailor_resume_bullets", "tailor_resume_bullets_async", "SYSTEM_PROMPT"]
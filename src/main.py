@@ -2,32 +2,43 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
-from typing import Iterable, List, Tuple
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
 
 try:  # pragma: no cover - optional dependency
     from rich import print as rich_print
-    from rich.logging import RichHandler
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     def rich_print(*args: object, **kwargs: object) -> None:
         """Fallback printer when ``rich`` is not installed."""
 
         print(*args, **kwargs)
-    
-    RichHandler = None  # type: ignore[assignment]
 
 from src.config import CALENDAR_ID, RSS_FEEDS
-from src.generator.cover_letter import cover_letter_draft
+from src.generator.cover_letter import cover_letter_draft, cover_letter_draft_async
 from src.generator.llm import LLM
-from src.generator.resume_tailor import tailor_resume_bullets
-from src.reminders.calendar_client import Calendar
-from src.sources.rss_client import parse_feeds
-from src.sources.simplify_client import SimplifyClient
-from src.tracker.sheets_client import SheetsTracker
+from src.generator.resume_tailor import tailor_resume_bullets, tailor_resume_bullets_async
+from src.tracker.schema import Job
+
+# Source, tracker and calendar clients pull in requests/feedparser/Google SDKs,
+# so they are imported inside the functions that use them.
+
+# Upper bound on LLM requests in flight during batch material generation
+MAX_CONCURRENT_LLM_CALLS = 8
 
 
 def _setup_logging() -> None:
-    """Configure logging with Rich handler if available, otherwise use basic config."""
+    """Configure logging with Rich handler if available, otherwise use basic config.
+
+    Called from :func:`main` only, so importing this module leaves the caller's
+    logging configuration untouched.
+    """
+    
+    try:  # pragma: no cover - optional dependency
+        from rich.logging import RichHandler
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        RichHandler = None  # type: ignore[assignment]
     
     # Configure root logger
     log_level = logging.INFO
@@ -54,52 +65,57 @@ def _setup_logging() -> None:
     logging.getLogger("tracker.sheets_client").setLevel(logging.INFO)
 
 
-# Initialize logging
-_setup_logging()
-logger = logging.getLogger(__name__)
+@lru_cache(maxsize=None)
+def _logger() -> logging.Logger:
+    """Return this module's logger, resolved on first use."""
+
+    return logging.getLogger(__name__)
 
 
-def fetch_jobs(query: str = "software engineering intern") -> List[dict]:
+def fetch_jobs(query: str = "software engineering intern") -> List[Job]:
     """Collect internship listings from configured sources."""
 
-    logger.info(f"Starting job fetch with query: '{query}'")
+    _logger().info(f"Starting job fetch with query: '{query}'")
     jobs = []
     
     # Simplify client (currently commented out)
     # try:
-    #     logger.info("Fetching jobs from Simplify...")
+    #     from src.sources.simplify_client import SimplifyClient
+    #
+    #     _logger().info("Fetching jobs from Simplify...")
     #     simplify_jobs = SimplifyClient().search(query=query)
     #     jobs.extend(simplify_jobs)
-    #     logger.info(f"Found {len(simplify_jobs)} jobs from Simplify")
+    #     _logger().info(f"Found {len(simplify_jobs)} jobs from Simplify")
     # except Exception as exc:  # pragma: no cover - network errors vary
-    #     logger.warning(f"Simplify search failed: {exc}")
+    #     _logger().warning(f"Simplify search failed: {exc}")
     #     rich_print(f"[yellow]Simplify search failed:[/yellow] {exc}")
     
     # RSS feeds
     if RSS_FEEDS:
-        logger.info(f"Processing {len(RSS_FEEDS)} RSS feeds...")
+        _logger().info(f"Processing {len(RSS_FEEDS)} RSS feeds...")
         try:
+            from src.sources.rss_client import parse_feeds
+
             rss_jobs = parse_feeds(RSS_FEEDS)
             jobs.extend(rss_jobs)
-            logger.info(f"Successfully collected {len(rss_jobs)} jobs from RSS feeds")
+            _logger().info(f"Successfully collected {len(rss_jobs)} jobs from RSS feeds")
         except Exception as exc:
-            logger.error(f"RSS feed processing failed: {exc}")
+            _logger().error(f"RSS feed processing failed: {exc}")
             rich_print(f"[red]RSS feed processing failed:[/red] {exc}")
     else:
-        logger.info("No RSS feeds configured")
+        _logger().info("No RSS feeds configured")
     
-    logger.info(f"Total jobs collected: {len(jobs)}")
+    _logger().info(f"Total jobs collected: {len(jobs)}")
     return jobs
 
 
-def ingest_jobs(jobs: Iterable[dict]) -> None:
+def ingest_jobs(jobs: Iterable[Job]) -> None:
     """Persist fetched jobs into the Google Sheet tracker."""
 
-    tracker = SheetsTracker()
-    count = 0
-    for job in jobs:
-        tracker.add_job(job)
-        count += 1
+    from src.tracker.sheets_client import SheetsTracker
+
+    with SheetsTracker() as tracker:
+        count = tracker.add_jobs(jobs)
     rich_print(f"[green]Added {count} jobs to Sheets.[/green]")
 
 
@@ -117,18 +133,68 @@ def generate_materials(
     return bullets, letter
 
 
+async def generate_materials_batch(
+    postings: Iterable[Tuple[str, str, str, List[str]]],
+    max_concurrency: int = MAX_CONCURRENT_LLM_CALLS,
+) -> List[Tuple[List[str], str]]:
+    """Create materials for many ``(company, role, job_desc, base_bullets)`` postings concurrently.
+
+    Results come back in posting order. Run from synchronous code with
+    ``asyncio.run(generate_materials_batch(postings))``.
+    """
+
+    import asyncio
+
+    llm = LLM()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(company: str, role: str, job_desc: str, base_bullets: List[str]) -> Tuple[List[str], str]:
+        async with semaphore:
+            bullets = await tailor_resume_bullets_async(llm, role, job_desc, base_bullets)
+        async with semaphore:
+            letter = await cover_letter_draft_async(llm, company, role, job_desc, bullets[:3])
+        return bullets, letter
+
+    return list(await asyncio.gather(*(_one(*posting) for posting in postings)))
+
+
 def add_deadline(title: str, deadline_iso: str, url: str | None = None) -> None:
     """Add an application deadline event to the configured calendar."""
 
+    from src.reminders.calendar_client import Calendar
+
     cal = Calendar(calendar_id=CALENDAR_ID)
     event = cal.add_deadline(title, deadline_iso, url=url)
     rich_print(f"[blue]Created calendar event:[/blue] {event.get('htmlLink')}")
 
 
-def main() -> None:
-    """Default CLI routine for fetching jobs and saving them to Sheets."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Describe the CLI subcommands without importing any provider modules."""
+
+    parser = argparse.ArgumentParser(description="Internship assistant workflow")
+    parser.set_defaults(query="software engineering intern")
+    subcommands = parser.add_subparsers(dest="command")
+
+    fetch = subcommands.add_parser("fetch", help="fetch jobs and save them to Sheets (default)")
+    fetch.add_argument("--query", default="software engineering intern")
+
+    deadline = subcommands.add_parser("deadline", help="add an application deadline to the calendar")
+    deadline.add_argument("title")
+    deadline.add_argument("deadline_iso", help="deadline as an ISO 8601 datetime")
+    deadline.add_argument("--url")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """CLI entry point; runs the fetch-and-save routine when no subcommand is given."""
+
+    args = _build_parser().parse_args(argv)
+    _setup_logging()
+    if args.command == "deadline":
+        add_deadline(args.title, args.deadline_iso, url=args.url)
+        return
 
-    jobs = fetch_jobs()
+    jobs = fetch_jobs(args.query)
     ingest_jobs(jobs)
     rich_print("[bold]Done.[/bold]")
 
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from random import choice
+import random
+from typing import Dict, Tuple
 
 from .interview_bank import BANK
 
+# Question lists frozen once at import so ``ask_random`` does no per-call fallback lookups
+_BANK_T: Dict[str, Tuple[str, ...]] = {domain: tuple(questions) for domain, questions in BANK.items()}
+_DEFAULT: Tuple[str, ...] = _BANK_T["behavioral"]
+_rng = random.Random()
+
 
 def ask_random(domain: str = "arrays") -> str:
     """Return a random question from the specified domain."""
 
-    return choice(BANK.get(domain, BANK["behavioral"]))
+    return _rng.choice(_BANK_T.get(domain, _DEFAULT))
 
 
 __all__ = ["ask_random"]
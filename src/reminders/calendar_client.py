@@ -4,45 +4,58 @@ from __future__ import annotations
 
 import datetime as dt
 import os
-from typing import Any, Dict
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict
 
-try:  # pragma: no cover - optional dependency for runtime integration
-    from googleapiclient.discovery import build
+if TYPE_CHECKING:  # pragma: no cover - typing only
     from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    build = None  # type: ignore[assignment]
-    Credentials = None  # type: ignore[assignment]
-    InstalledAppFlow = None  # type: ignore[assignment]
-    Request = None  # type: ignore[assignment]
 
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 
 
+@lru_cache(maxsize=None)
+def _google_api() -> SimpleNamespace:
+    """Import the Google client libraries on first use rather than at module import."""
+
+    try:
+        from googleapiclient.discovery import build
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise ModuleNotFoundError(
+            "google-api-python-client and Google auth libraries are required for Calendar integration"
+        ) from exc
+    return SimpleNamespace(
+        build=build,
+        Credentials=Credentials,
+        InstalledAppFlow=InstalledAppFlow,
+        Request=Request,
+    )
+
+
 class Calendar:
     """Lightweight wrapper around the Google Calendar API."""
 
     def __init__(self, calendar_id: str = "primary") -> None:
-        if build is None or Credentials is None or InstalledAppFlow is None or Request is None:
-            raise ModuleNotFoundError(
-                "google-api-python-client and Google auth libraries are required for Calendar integration"
-            )
+        google = _google_api()
         self.calendar_id = calendar_id
         self.creds = self._auth()
-        self.service = build("calendar", "v3", credentials=self.creds)
+        self.service = google.build("calendar", "v3", credentials=self.creds)
 
     def _auth(self) -> Credentials:
         """Authenticate using OAuth, caching the token for future runs."""
 
+        google = _google_api()
         creds = None
         if os.path.exists("token.json"):
-            creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+            creds = google.Credentials.from_authorized_user_file("token.json", SCOPES)
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
+                creds.refresh(google.Request())
             else:
-                flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
+                flow = google.InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
                 creds = flow.run_local_server(port=0)
             with open("token.json", "w", encoding="utf-8") as token:
                 token.write(creds.to_json())
@@ -4,30 +4,25 @@ from __future__ import annotations
 
 from typing import Dict, Iterable
 
-try:  # pragma: no cover - optional dependency
-    import requests
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    requests = None  # type: ignore[assignment]
-
 try:  # pragma: no cover - optional dependency
     from bs4 import BeautifulSoup
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     BeautifulSoup = None  # type: ignore[assignment]
 
+from src.sources.session import get_session
+
 BASE_URL = "https://www.amazon.jobs/en/search"
 
 
 def fetch_listings(keyword: str = "software", location: str | None = None) -> Iterable[Dict]:
     """Yield normalized Amazon postings scraped from the search results page."""
 
-    if requests is None:
-        raise ModuleNotFoundError("requests is required to fetch Amazon listings")
     if BeautifulSoup is None:
         raise ModuleNotFoundError("beautifulsoup4 is required to parse Amazon listings")
     params = {"base_query": keyword, "category[]": "software-development", "job_type": "Internship"}
     if location:
         params["location"] = location
-    response = requests.get(BASE_URL, params=params, timeout=30)
+    response = get_session().get(BASE_URL, params=params, timeout=30)
     response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
     for card in soup.select("div.job-tile"):  # pragma: no cover - requires network
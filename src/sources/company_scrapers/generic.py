@@ -4,25 +4,27 @@ from __future__ import annotations
 
 from typing import Callable, Dict, Iterable, List
 
+from src.tracker.schema import Job
 
-def normalize_job(raw: Dict) -> Dict:
+
+def normalize_job(raw: Dict) -> Job:
     """Normalize a raw job dictionary to the tracker schema."""
 
-    return {
-        "company": raw.get("company", ""),
-        "role": raw.get("role", ""),
-        "location": raw.get("location", ""),
-        "deadline": raw.get("deadline", ""),
-        "apply_link": raw.get("apply_link", ""),
-        "source": raw.get("source", "scraper:generic"),
-        "notes": raw.get("notes", ""),
-    }
+    return Job(
+        company=raw.get("company", ""),
+        role=raw.get("role", ""),
+        location=raw.get("location", ""),
+        deadline=raw.get("deadline", ""),
+        apply_link=raw.get("apply_link", ""),
+        source=raw.get("source", "scraper:generic"),
+        notes=raw.get("notes", ""),
+    )
 
 
-def collect_jobs(fetch_fn: Callable[[], Iterable[Dict]]) -> List[Dict]:
+def collect_jobs(fetch_fn: Callable[[], Iterable[Dict]]) -> List[Job]:
     """Helper to transform an iterable of raw postings."""
 
-    jobs: List[Dict] = []
+    jobs: List[Job] = []
     for raw in fetch_fn():
         jobs.append(normalize_job(raw))
     return jobs
@@ -2,42 +2,208 @@
 
 from __future__ import annotations
 
+import json
 import logging
 import re
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
 from urllib.parse import urlparse
 
-try:  # pragma: no cover - optional dependency
-    import feedparser
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    feedparser = None  # type: ignore[assignment]
+from src.sources.session import get_session
+from src.tracker.schema import Job
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Rate limiting delay between feed requests (seconds)
+# Rate limiting delay between requests to the same host (seconds)
 FEED_REQUEST_DELAY = 1.0
 
-# Common location patterns to extract from job descriptions
-LOCATION_PATTERNS = [
-    r"Location:\s*([^,\n]+)",
-    r"Based in:\s*([^,\n]+)",
-    r"Office:\s*([^,\n]+)",
-    r"Remote|Work from home|WFH",
-    r"([A-Z][a-z]+,\s*[A-Z]{2})",  # City, State format
-    r"([A-Z][a-z\s]+,\s*[A-Z][a-z\s]+)",  # City, Country format
+# Maximum number of feeds fetched concurrently
+FEED_WORKERS = 8
+
+# Per-request timeout for feed downloads (seconds)
+FEED_TIMEOUT = 30
+
+# Cache file holding conditional-GET validators and normalized jobs per feed
+FEED_CACHE_PATH = Path.home() / ".cache" / "tracker" / "rss_cache.json"
+
+# Common location patterns to extract from job descriptions, in priority order
+LOCATION_PATTERNS: List[re.Pattern[str]] = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Location:\s*([^,\n]+)",
+        r"Based in:\s*([^,\n]+)",
+        r"Office:\s*([^,\n]+)",
+        r"Remote|Work from home|WFH",
+        r"([A-Z][a-z]+,\s*[A-Z]{2})",  # City, State format
+        r"([A-Z][a-z\s]+,\s*[A-Z][a-z\s]+)",  # City, Country format
+    )
 ]
 
 # Deadline patterns
-DEADLINE_PATTERNS = [
-    r"Apply by:\s*([^,\n]+)",
-    r"Deadline:\s*([^,\n]+)",
-    r"Applications close:\s*([^,\n]+)",
+DEADLINE_PATTERNS: List[re.Pattern[str]] = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Apply by:\s*([^,\n]+)",
+        r"Deadline:\s*([^,\n]+)",
+        r"Applications close:\s*([^,\n]+)",
+    )
 ]
 
+# Deadline formats tried when python-dateutil is unavailable
+DEADLINE_FORMATS = ("%m/%d/%Y", "%B %d, %Y", "%b %d, %Y")
+
+# Two unrelated defaults for dateutil: a date that parses the same under both
+# was fully specified by the text rather than completed from the defaults
+_DATE_DEFAULTS = (datetime(2000, 1, 1), datetime(2004, 12, 28))
+
+
+@lru_cache(maxsize=None)
+def _feedparser() -> Any:
+    """Import feedparser on first use, returning ``None`` when it is not installed."""
+
+    try:
+        import feedparser
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return feedparser
+
+
+@lru_cache(maxsize=None)
+def _etree() -> Any:
+    """Import ``lxml.etree`` on first use, returning ``None`` when lxml is not installed."""
+
+    try:
+        from lxml import etree
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return etree
+
+
+@lru_cache(maxsize=None)
+def _date_parser() -> Any:
+    """Import ``dateutil.parser`` on first use, returning ``None`` when it is not installed."""
+
+    try:
+        from dateutil import parser as date_parser
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return date_parser
+
+
+class _FeedCache:
+    """On-disk cache of ``etag``/``modified`` validators and parsed jobs per feed URL."""
+
+    def __init__(self, path: Path = FEED_CACHE_PATH) -> None:
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            self._entries = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Ignoring unreadable RSS cache {path}: {exc}")
+
+    def get(self, url: str) -> Dict[str, Any]:
+        """Return the cached entry for ``url`` (empty when the feed is unseen)."""
+
+        return self._entries.get(url, {})
+
+    def update(
+        self,
+        url: str,
+        etag: str | None,
+        modified: str | None,
+        jobs: List[Job],
+        guids: Dict[str, int | None] | None = None,
+    ) -> None:
+        """Record fresh validators, the feed's jobs and where each entry guid's job sits in them.
+
+        ``guids`` maps every entry id currently in the feed to its index in
+        ``jobs``, or ``None`` when the entry produced no job.
+        """
+
+        entry = {
+            "etag": etag,
+            "modified": modified,
+            "jobs": [asdict(job) for job in jobs],
+            "guids": guids or {},
+        }
+        with self._lock:
+            self._entries[url] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist the cache if anything changed since it was loaded."""
+
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self._entries), encoding="utf-8")
+            self._dirty = False
+        except OSError as exc:
+            logger.warning(f"Could not write RSS cache {self.path}: {exc}")
+
 
+class _HostThrottle:
+    """Space out requests to the same host by ``FEED_REQUEST_DELAY`` seconds."""
+
+    def __init__(self, delay: float = FEED_REQUEST_DELAY) -> None:
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = defaultdict(float)
+
+    def wait(self, url: str) -> None:
+        """Block until ``url``'s host may be contacted again."""
+
+        host = _feed_host(url)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot[host])
+            self._next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _entry_texts(entry: Dict) -> Tuple[str, ...]:
+    """Return the entry's non-empty summary and description, searched in that order."""
+
+    summary = entry.get("summary") or ""
+    description = entry.get("description") or ""
+    # feedparser aliases ``description`` to ``summary``; don't search the same text twice
+    texts = (summary,) if description == summary else (summary, description)
+    return tuple(text for text in texts if text)
+
+
+def _first_match(patterns: List[re.Pattern[str]], texts: Tuple[str, ...]) -> str | None:
+    """Return the value of the highest-priority pattern that matches, searching each text in turn."""
+
+    for pattern in patterns:
+        for text in texts:
+            match = pattern.search(text)
+            if match:
+                return match.group(1) if pattern.groups else match.group(0)
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _feed_host(url: str) -> str:
+    """Return the host part of a feed URL, used to key per-host rate limiting."""
+    return urlparse(url).netloc
+
+
+@lru_cache(maxsize=1024)
 def _is_valid_rss_url(url: str) -> bool:
     """Validate that a URL looks like a proper RSS feed URL."""
     try:
@@ -47,24 +213,20 @@ def _is_valid_rss_url(url: str) -> bool:
         return False
 
 
-def _extract_location(entry: Dict) -> str:
+def _extract_location(entry: Dict, texts: Tuple[str, ...]) -> str:
     """Extract location information from RSS entry."""
     # Check common fields first
-    if hasattr(entry, 'location') and entry.location:
-        return entry.location.strip()
+    if entry.get("location"):
+        return entry["location"].strip()
     
     # Search in summary/description
-    content = entry.get("summary", "") + " " + entry.get("description", "")
-    
-    for pattern in LOCATION_PATTERNS:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            location = match.group(1) if match.groups() else match.group(0)
-            return location.strip()
+    location = _first_match(LOCATION_PATTERNS, texts)
+    if location is not None:
+        return location.strip()
     
     # Check tags for location information
-    if hasattr(entry, 'tags'):
-        for tag in entry.tags:
+    if entry.get("tags"):
+        for tag in entry["tags"]:
             tag_term = tag.get('term', '').lower()
             if any(loc_word in tag_term for loc_word in ['location', 'city', 'remote', 'office']):
                 return tag.get('term', '').strip()
@@ -72,32 +234,44 @@ def _extract_location(entry: Dict) -> str:
     return ""
 
 
-def _extract_deadline(entry: Dict) -> str:
-    """Extract deadline information from RSS entry."""
-    content = entry.get("summary", "") + " " + entry.get("description", "")
-    
-    for pattern in DEADLINE_PATTERNS:
-        match = re.search(pattern, content, re.IGNORECASE)
-        if match:
-            deadline_text = match.group(1).strip()
-            # Try to parse common date formats
-            try:
-                # Handle various date formats
-                for date_format in ["%Y-%m-%d", "%m/%d/%Y", "%B %d, %Y", "%b %d, %Y"]:
-                    try:
-                        parsed_date = datetime.strptime(deadline_text, date_format)
-                        return parsed_date.date().isoformat()
-                    except ValueError:
-                        continue
-                # If no format matches, return the raw text
-                return deadline_text
-            except Exception:
-                return deadline_text
+def _parse_deadline(deadline_text: str) -> str:
+    """Normalize a deadline to an ISO date, returning the raw text when it cannot be parsed."""
+    try:
+        return date.fromisoformat(deadline_text).isoformat()
+    except ValueError:
+        pass
     
-    return ""
+    date_parser = _date_parser()
+    if date_parser is not None:
+        try:
+            first, second = (date_parser.parse(deadline_text, default=default) for default in _DATE_DEFAULTS)
+        except (ValueError, OverflowError):
+            return deadline_text
+        # Partial dates ("March 1", "Friday", "5") would be filled in from the defaults
+        return first.date().isoformat() if first.date() == second.date() else deadline_text
+    
+    try:
+        return parsedate_to_datetime(deadline_text).date().isoformat()
+    except (TypeError, ValueError):
+        pass
+    for date_format in DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(deadline_text, date_format).date().isoformat()
+        except ValueError:
+            continue
+    # If no format matches, return the raw text
+    return deadline_text
+
+
+def _extract_deadline(texts: Tuple[str, ...]) -> str:
+    """Extract deadline information from RSS entry."""
+    deadline = _first_match(DEADLINE_PATTERNS, texts)
+    if deadline is None:
+        return ""
+    return _parse_deadline(deadline.strip())
 
 
-def _create_job_record(entry: Dict, feed_url: str) -> Dict[str, str]:
+def _create_job_record(entry: Dict, feed_url: str) -> Job:
     """Create a normalized job record from an RSS entry."""
     # Extract company name with fallbacks
     company = (
@@ -110,9 +284,10 @@ def _create_job_record(entry: Dict, feed_url: str) -> Dict[str, str]:
     # Extract role/title
     role = entry.get("title", "").strip()
     
-    # Extract location and deadline
-    location = _extract_location(entry)
-    deadline = _extract_deadline(entry)
+    # Extract location and deadline from summary/description
+    texts = _entry_texts(entry)
+    location = _extract_location(entry, texts)
+    deadline = _extract_deadline(texts)
     
     # Get apply link
     apply_link = entry.get("link", "").strip()
@@ -128,93 +303,275 @@ def _create_job_record(entry: Dict, feed_url: str) -> Dict[str, str]:
     
     notes = " | ".join(notes_parts)
     
-    return {
-        "company": company,
-        "role": role,
-        "location": location,
-        "deadline": deadline,
-        "apply_link": apply_link,
-        "source": f"rss:{feed_url}",
-        "notes": notes,
-    }
+    return Job(
+        company=company,
+        role=role,
+        location=location,
+        deadline=deadline,
+        apply_link=apply_link,
+        source=f"rss:{feed_url}",
+        notes=notes,
+    )
 
 
-def _generate_job_key(job: Dict[str, str]) -> str:
+def _generate_job_key(job: Job) -> Tuple[str, str, str]:
     """Generate a unique key for duplicate detection."""
     # Use company, role, and apply_link for uniqueness
-    company = job.get("company", "").lower().strip()
-    role = job.get("role", "").lower().strip()
-    link = job.get("apply_link", "").strip()
-    return f"{company}|{role}|{link}"
+    return (job.company.lower().strip(), job.role.lower().strip(), job.apply_link.strip())
+
 
+def _entry_guid(entry: Dict) -> str | None:
+    """Return a stable identifier for an entry, falling back to its link."""
+    return entry.get("id") or entry.get("link") or None
 
-def parse_feeds(feeds: List[str]) -> List[Dict]:
-    """Convert RSS feeds into normalized job records with improved error handling and data extraction."""
+
+def _local_name(tag: Any) -> str:
+    """Strip the ``{namespace}`` prefix from an lxml tag (comments/PIs have no string tag)."""
+    return tag.rpartition("}")[2] if isinstance(tag, str) else ""
+
+
+def _element_text(element: Any) -> str:
+    """Return all text inside an element, including nested markup, stripped."""
+    return "".join(element.itertext()).strip()
+
+
+def _fast_parse(xml_bytes: bytes) -> List[Dict[str, Any]] | None:
+    """Extract just the entry fields used here from RSS/Atom XML in one lxml pass.
+
+    Entries are plain dicts shaped like feedparser's (``title``, ``link``,
+    ``author``, ``summary``, ``content``, ``tags``, ``id``, ``location``).
+    Returns ``None`` when lxml is unavailable or the document is not a
+    well-formed RSS/Atom feed, so the caller can fall back to feedparser.
+    """
+    etree = _etree()
+    if etree is None:
+        return None
+    # A parser per call: lxml parsers must not be shared between threads
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    try:
+        root = etree.fromstring(xml_bytes, parser)
+    except etree.XMLSyntaxError:
+        return None
+    if root is None or _local_name(root.tag) not in ("rss", "feed", "RDF"):
+        return None
     
-    if feedparser is None:
-        raise ModuleNotFoundError("feedparser is required to parse RSS feeds")
+    entries: List[Dict[str, Any]] = []
+    for item in root.iter("{*}item", "{*}entry"):
+        entry: Dict[str, Any] = {}
+        tags: List[Dict[str, str]] = []
+        for child in item:
+            name = _local_name(child.tag)
+            if name == "title":
+                entry["title"] = _element_text(child)
+            elif name == "link":
+                href = child.get("href")
+                if href is None:
+                    entry.setdefault("link", _element_text(child))
+                elif child.get("rel", "alternate") == "alternate":
+                    entry.setdefault("link", href)
+            elif name in ("author", "creator"):
+                author_name = child.find("{*}name")
+                entry.setdefault("author", _element_text(author_name if author_name is not None else child))
+            elif name in ("description", "summary"):
+                entry.setdefault("summary", _element_text(child))
+            elif name in ("encoded", "content"):
+                content_text = _element_text(child)
+                if content_text:
+                    entry.setdefault("content", [{"value": content_text}])
+            elif name == "category":
+                term = child.get("term") or _element_text(child)
+                if term:
+                    tags.append({"term": term})
+            elif name in ("guid", "id"):
+                entry.setdefault("id", _element_text(child))
+            elif name == "location":
+                entry["location"] = _element_text(child)
+        if tags:
+            entry["tags"] = tags
+        if "summary" not in entry and "content" in entry:
+            # feedparser copies the content into ``summary`` when an entry has none
+            entry["summary"] = entry["content"][0]["value"]
+        entries.append(entry)
+    return entries
+
+
+def _job_from_entry(entry: Dict, url: str) -> Job | None:
+    """Build the job record for one entry, or ``None`` when the entry is unusable."""
+
+    try:
+        job = _create_job_record(entry, url)
+    except Exception as exc:
+        logger.error(f"Error processing entry from {url}: {exc}")
+        return None
+
+    # Skip jobs with missing critical information
+    if not job.role or not job.apply_link:
+        logger.debug(f"Skipping job with missing title or link from {url}")
+        return None
+    return job
+
+
+def _known_jobs(cached: Dict[str, Any]) -> Dict[str, Job | None]:
+    """Map each entry guid from the previous run to its cached job (``None`` if it was skipped)."""
+
+    jobs = [Job(**job) for job in cached.get("jobs", [])]
+    return {
+        guid: jobs[index] if index is not None and index < len(jobs) else None
+        for guid, index in cached.get("guids", {}).items()
+    }
+
+
+def _jobs_from_entries(
+    entries: List[Dict], url: str, known: Dict[str, Job | None] | None = None
+) -> Tuple[List[Job], Dict[str, int | None]]:
+    """Build job records for every usable entry of a single feed, in feed order.
+
+    Entries whose guid is in ``known`` reuse the job built on a previous run
+    instead of being processed again. Also returns each guid's index in the
+    result (``None`` for skipped entries) for the feed cache.
+    """
+
+    known = known or {}
+    # The entry count bounds the result, so size the list once and trim at the end
+    feed_jobs: List[Job] = [None] * len(entries)  # type: ignore[list-item]
+    guids: Dict[str, int | None] = {}
+    count = 0
+    reused = 0
+    for entry in entries:
+        guid = _entry_guid(entry)
+        if guid is not None and guid in known:
+            job = known[guid]
+            reused += 1
+        else:
+            job = _job_from_entry(entry, url)
+        if guid is not None:
+            guids[guid] = count if job is not None else None
+        if job is None:
+            continue
+        feed_jobs[count] = job
+        count += 1
+    del feed_jobs[count:]
+    if reused:
+        logger.info(f"{len(entries) - reused} new entries since last run in RSS feed: {url}")
+    return feed_jobs, guids
+
+
+def _fetch_one(url: str, cache: _FeedCache, throttle: _HostThrottle) -> List[Job]:
+    """Fetch a single feed and return its job records (before cross-feed deduplication)."""
+
+    try:
+        throttle.wait(url)
+        logger.info(f"Fetching RSS feed: {url}")
+        cached = cache.get(url)
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            headers["If-Modified-Since"] = cached["modified"]
+        response = get_session().get(url, headers=headers, timeout=FEED_TIMEOUT)
+
+        if response.status_code == 304:
+            logger.info(f"RSS feed not modified, reusing cached jobs: {url}")
+            return [Job(**job) for job in cached.get("jobs", [])]
+        if response.status_code == 410:
+            logger.warning(f"RSS feed is gone (HTTP 410), skipping: {url}")
+            return []
+        response.raise_for_status()
+
+        entries = _fast_parse(response.content)
+        if entries is None:
+            feedparser = _feedparser()
+            if feedparser is None:
+                logger.error(f"RSS feed is not well-formed XML and feedparser is not installed: {url}")
+                return []
+            response_headers = {key.lower(): value for key, value in response.headers.items()}
+            response_headers.setdefault("content-location", response.url)
+            parsed = feedparser.parse(response.content, response_headers=response_headers)
+
+            # Check if feed was parsed successfully
+            if hasattr(parsed, 'bozo') and parsed.bozo:
+                logger.warning(f"RSS feed may have issues: {url} - {getattr(parsed, 'bozo_exception', 'Unknown error')}")
+            entries = getattr(parsed, 'entries', None)
+
+        if not entries:
+            logger.warning(f"No entries found in RSS feed: {url}")
+            return []
+
+        # Only entries whose guid was not in the feed last run are processed;
+        # this does not assume any particular entry order
+        feed_jobs, guids = _jobs_from_entries(entries, url, _known_jobs(cached))
+
+        cache.update(
+            url,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            feed_jobs,
+            guids,
+        )
+        return feed_jobs
+
+    except Exception as exc:
+        logger.error(f"RSS feed error for {url}: {exc}")
+        return []
+
+
+def parse_feeds(feeds: List[str], cache_path: Path = FEED_CACHE_PATH) -> List[Job]:
+    """Convert RSS feeds into normalized job records with improved error handling and data extraction.
+
+    Feeds are fetched concurrently over the shared HTTP session (requests to the
+    same host are still spaced by ``FEED_REQUEST_DELAY``) with a conditional GET
+    using the ``etag``/``modified`` validators stored in ``cache_path``; unchanged
+    feeds (HTTP 304) reuse the jobs parsed on the previous run instead of being
+    parsed again.
+    """
+    
+    if _etree() is None and _feedparser() is None:
+        raise ModuleNotFoundError("feedparser or lxml is required to parse RSS feeds")
+    get_session()  # fail fast when requests is not installed
     
     if not feeds:
         logger.info("No RSS feeds configured")
         return []
     
-    jobs: List[Dict] = []
-    seen_jobs: Set[str] = set()
-    
-    for i, url in enumerate(feeds):
+    urls: List[str] = []
+    for url in feeds:
         if not _is_valid_rss_url(url):
             logger.warning(f"Invalid RSS URL format: {url}")
             continue
-            
-        # Rate limiting - add delay between requests
-        if i > 0:
-            time.sleep(FEED_REQUEST_DELAY)
+        urls.append(url)
+    
+    cache = _FeedCache(cache_path)
+    throttle = _HostThrottle()
+    results: List[List[Job]] = [[] for _ in urls]
+    
+    with ThreadPoolExecutor(max_workers=min(FEED_WORKERS, len(urls) or 1)) as executor:
+        futures = {executor.submit(_fetch_one, url, cache, throttle): i for i, url in enumerate(urls)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    # Deduplicate in feed order so the outcome does not depend on fetch timing
+    jobs: List[Job] = []
+    seen_jobs: Set[Tuple[str, str, str]] = set()
+    
+    for url, feed_jobs in zip(urls, results):
+        feed_jobs_count = 0
+        duplicates_count = 0
         
-        try:
-            logger.info(f"Fetching RSS feed: {url}")
-            parsed = feedparser.parse(url)
-            
-            # Check if feed was parsed successfully
-            if hasattr(parsed, 'bozo') and parsed.bozo:
-                logger.warning(f"RSS feed may have issues: {url} - {getattr(parsed, 'bozo_exception', 'Unknown error')}")
-            
-            if not hasattr(parsed, 'entries') or not parsed.entries:
-                logger.warning(f"No entries found in RSS feed: {url}")
+        for job in feed_jobs:
+            job_key = _generate_job_key(job)
+            if job_key in seen_jobs:
+                duplicates_count += 1
+                logger.debug(f"Duplicate job found: {job.company} - {job.role}")
                 continue
-                
-            feed_jobs_count = 0
-            duplicates_count = 0
-            
-            for entry in parsed.entries:
-                try:
-                    job = _create_job_record(entry, url)
-                    
-                    # Skip jobs with missing critical information
-                    if not job["role"] or not job["apply_link"]:
-                        logger.debug(f"Skipping job with missing title or link from {url}")
-                        continue
-                    
-                    # Check for duplicates
-                    job_key = _generate_job_key(job)
-                    if job_key in seen_jobs:
-                        duplicates_count += 1
-                        logger.debug(f"Duplicate job found: {job['company']} - {job['role']}")
-                        continue
-                    
-                    seen_jobs.add(job_key)
-                    jobs.append(job)
-                    feed_jobs_count += 1
-                    
-                except Exception as exc:
-                    logger.error(f"Error processing entry from {url}: {exc}")
-                    continue
             
+            seen_jobs.add(job_key)
+            jobs.append(job)
+            feed_jobs_count += 1
+        
+        if feed_jobs:
             logger.info(f"Processed {feed_jobs_count} jobs from {url} ({duplicates_count} duplicates skipped)")
-            
-        except Exception as exc:
-            logger.error(f"RSS feed error for {url}: {exc}")
-            continue
     
+    cache.save()
     logger.info(f"Total jobs collected from RSS feeds: {len(jobs)}")
     return jobs
 
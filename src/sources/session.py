@@ -0,0 +1,40 @@
+"""Shared HTTP session reused by the job source clients."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import requests
+
+# Connection pool sizing: distinct hosts kept alive, and connections per host
+POOL_CONNECTIONS = 8
+POOL_MAXSIZE = 16
+
+_session: "requests.Session | None" = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """Return the process-wide session so TCP/TLS connections are reused across requests."""
+
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                # Imported on first use: requests is slow to import and not every command needs it
+                try:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+                    raise ModuleNotFoundError("requests is required for HTTP job sources") from exc
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+__all__ = ["get_session"]
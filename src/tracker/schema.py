@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass, fields
+from typing import Dict, List
 
 COLUMNS: List[str] = [
     "added_at",  # ISO timestamp
@@ -19,4 +20,25 @@ COLUMNS: List[str] = [
 ]
 
 
-__all__ = ["COLUMNS"]
+@dataclass(slots=True)
+class Job:
+    """A normalized job posting as produced by the sources."""
+
+    company: str = ""
+    role: str = ""
+    location: str = ""
+    deadline: str = ""
+    apply_link: str = ""
+    source: str = ""
+    notes: str = ""
+    resume_file: str = ""
+    cover_letter_file: str = ""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> Job:
+        """Build a job from a legacy posting dict, ignoring unknown keys."""
+
+        return cls(**{field.name: data.get(field.name, "") for field in fields(cls)})
+
+
+__all__ = ["COLUMNS", "Job"]
@@ -2,98 +2,641 @@
 
 from __future__ import annotations
 
+import hashlib
+import importlib.util
+import json
+import logging
 import os
+import random
+import tempfile
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Iterable, List
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from types import SimpleNamespace, TracebackType
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, Iterable, List
 
-try:  # pragma: no cover - optional dependency for runtime integration
-    from googleapiclient.discovery import build
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
+try:  # pragma: no cover - optional dependency
+    import orjson
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    build = None  # type: ignore[assignment]
-    Credentials = None  # type: ignore[assignment]
-    InstalledAppFlow = None  # type: ignore[assignment]
-    Request = None  # type: ignore[assignment]
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import asyncio
+
+    import httpx
+    from google.oauth2.credentials import Credentials
 
-from src.config import SPREADSHEET_ID
-from src.tracker.schema import COLUMNS
+from src.config import SHEETS_FLUSH_THRESHOLD, SPREADSHEET_ID, TRACKER_FORCE_SHEET_CHECK
+from src.tracker.schema import COLUMNS, Job
+
+logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 SHEET_NAME = "Internships"
 
+# Rows sent per values().append call when writing jobs in bulk
+APPEND_BATCH_SIZE = 500
+
+# REST endpoint used when writing rows over httpx
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+
+# Job dict keys in sheet column order (timestamp and status are filled in separately)
+_ROW_KEYS = (
+    "company",
+    "role",
+    "location",
+    "deadline",
+    "apply_link",
+    "source",
+    "resume_file",
+    "cover_letter_file",
+    "notes",
+)
+_get_row_values = itemgetter(*_ROW_KEYS)
+
+# Blank row and column index per job key, used to lay out partially filled job dicts
+_ROW_TEMPLATE = ["", "", "", "", "", "", "", "new", "", "", ""]
+_FIELD_IDX = {key: COLUMNS.index(key) for key in _ROW_KEYS}
+
+# Responses retried with backoff: rate limited (429) and temporarily unavailable (503)
+RETRY_STATUSES = frozenset({429, 503})
+MAX_ATTEMPTS = 6
+MAX_BACKOFF = 32.0
+
+# Google's documented per-user write quota for the Sheets API
+WRITES_PER_MINUTE = 60
+
+TOKEN_PATH = Path("token.json")
+
+# Per-user directory holding the sheet-ready markers
+CACHE_DIR = Path.home() / ".cache" / "tracker"
+
+
+@lru_cache(maxsize=None)
+def _google_api() -> SimpleNamespace:
+    """Import the Google client libraries on first use rather than at module import."""
+
+    try:
+        from googleapiclient.discovery import build
+        from googleapiclient.errors import HttpError
+        from googleapiclient.http import build_http
+        from google.oauth2.credentials import Credentials
+        from google_auth_httplib2 import AuthorizedHttp
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+    except ModuleNotFoundError as exc:  # pragma: no cover - optional dependency
+        raise ModuleNotFoundError(
+            "google-api-python-client and Google auth libraries are required for Sheets integration"
+        ) from exc
+    return SimpleNamespace(
+        build=build,
+        HttpError=HttpError,
+        Credentials=Credentials,
+        AuthorizedHttp=AuthorizedHttp,
+        build_http=build_http,
+        InstalledAppFlow=InstalledAppFlow,
+        Request=Request,
+    )
+
+
+@lru_cache(maxsize=None)
+def _httpx() -> Any:
+    """Import httpx on first use, returning ``None`` when it is not installed."""
+
+    try:
+        import httpx
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
+        return None
+    return httpx
+
+
+def _http2_supported() -> bool:
+    """Return whether the ``h2`` package needed for httpx's HTTP/2 support is installed."""
+
+    return importlib.util.find_spec("h2") is not None
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Return the wait before retry ``attempt``, honouring a numeric ``Retry-After`` header."""
+
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(MAX_BACKOFF, 2**attempt + random.random())
+
+
+class _TokenBucket:
+    """Allow ``rate`` acquisitions per ``period`` seconds, bursting up to ``rate``."""
+
+    def __init__(self, rate: int, period: float = 60.0) -> None:
+        self.capacity = float(rate)
+        self.refill = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.refill
+
+    def wait(self) -> None:
+        """Block until a token is available."""
+
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string at second precision."""
+
+    return datetime.utcnow().isoformat(timespec="seconds")
+
+
+def _warn_unflushed(pending: List[List[str]], spreadsheet_id: str) -> None:
+    """Log rows a tracker still held when it was garbage collected or the interpreter exited."""
+
+    if pending:
+        logger.warning(
+            f"SheetsTracker for {spreadsheet_id} discarded with {len(pending)} unwritten rows; "
+            "call flush() or use the tracker in a with block"
+        )
+
+
+def _dumps(body: Dict[str, Any]) -> bytes:
+    """Serialize a request body, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(body, separators=(",", ":")).encode()
+
+
+@lru_cache(maxsize=4)
+def _load_token(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a token file, re-reading it only when its modification time changes."""
+
+    return json.loads(Path(path).read_bytes())
+
+
+def _save_token(creds: Credentials) -> None:
+    """Persist refreshed credentials, rewriting ``token.json`` only when it changed.
+
+    The file is replaced atomically so concurrent runs never read a torn token.
+    """
+
+    new = creds.to_json()
+    try:
+        if TOKEN_PATH.read_text(encoding="utf-8") == new:
+            return
+    except OSError:
+        pass
+    fd, tmp_path = tempfile.mkstemp(dir=TOKEN_PATH.parent, prefix=f".{TOKEN_PATH.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as token:
+            token.write(new)
+        os.replace(tmp_path, TOKEN_PATH)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 
 class SheetsTracker:
-    """Wrapper for writing job postings to a Google Sheet."""
+    """Wrapper for writing job postings to a Google Sheet.
+
+    Job rows are buffered and written in bulk; use the tracker as a context
+    manager (or call :meth:`flush`) so the last partial batch is written.
+    """
+
+    # Built services keyed by access token, shared by trackers using the same credentials
+    _service_cache: ClassVar[Dict[str, Any]] = {}
+    # Write quota is per user, so every tracker in the process draws from one bucket
+    _write_bucket: ClassVar[_TokenBucket] = _TokenBucket(WRITES_PER_MINUTE)
+    # Per-thread authorized transports keyed by access token (httplib2.Http is not thread-safe)
+    _transports: ClassVar[threading.local] = threading.local()
 
     def __init__(self, spreadsheet_id: str | None = SPREADSHEET_ID) -> None:
-        if build is None or Credentials is None or InstalledAppFlow is None or Request is None:
-            raise ModuleNotFoundError(
-                "google-api-python-client and Google auth libraries are required for Sheets integration"
-            )
+        _google_api()
         if not spreadsheet_id:
             raise ValueError("A spreadsheet ID must be configured before using SheetsTracker")
         self.spreadsheet_id = spreadsheet_id
+        self._pending: List[List[str]] = []
+        weakref.finalize(self, _warn_unflushed, self._pending, spreadsheet_id)
+        self._flush_threshold = SHEETS_FLUSH_THRESHOLD
+        self._sheet_ready = False
+        self._client: httpx.Client | None = None
         self.creds = self._auth()
-        self.service = build("sheets", "v4", credentials=self.creds)
+        self.service = self._get_service(self.creds)
         self._ensure_sheet()
 
+    @classmethod
+    def _get_service(cls, creds: Credentials) -> Any:
+        """Return the Sheets service for ``creds``, building it only once per token."""
+
+        service = cls._service_cache.get(creds.token)
+        if service is None:
+            service = cls._service_cache[creds.token] = _google_api().build("sheets", "v4", credentials=creds)
+        return service
+
+    @classmethod
+    def prime(cls, ids: Iterable[str], max_workers: int = 8) -> List[SheetsTracker]:
+        """Create trackers for several spreadsheets, running their startup checks concurrently.
+
+        The first tracker is built on the calling thread so authentication and
+        the shared service are set up once; the rest reuse them from a pool.
+        Trackers are returned in the order of ``ids``.
+        """
+
+        ids = list(ids)
+        if not ids:
+            return []
+        first = cls(ids[0])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [first, *executor.map(cls, ids[1:])]
+
+    def _thread_http(self) -> Any:
+        """Return the calling thread's authorized HTTP transport for these credentials.
+
+        ``httplib2.Http`` is not thread-safe, so googleapiclient requests are
+        executed over a per-thread transport instead of the shared service's.
+        Trackers on the same thread with the same token share one transport,
+        and with it the open connection.
+        """
+
+        transports = getattr(self._transports, "by_token", None)
+        if transports is None:
+            transports = self._transports.by_token = {}
+        http = transports.get(self.creds.token)
+        if http is None:
+            google = _google_api()
+            http = transports[self.creds.token] = google.AuthorizedHttp(self.creds, http=google.build_http())
+        return http
+
     def _auth(self) -> Credentials:
         """Authenticate the Sheets client, caching tokens locally."""
 
-        creds = None
-        if os.path.exists("token.json"):
-            creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+        google = _google_api()
+        try:
+            mtime_ns = TOKEN_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            creds = None
+        else:
+            creds = google.Credentials.from_authorized_user_info(_load_token(str(TOKEN_PATH), mtime_ns), SCOPES)
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
+                creds.refresh(google.Request())
             else:
-                flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
+                flow = google.InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
                 creds = flow.run_local_server(port=0)
-            with open("token.json", "w", encoding="utf-8") as token:
-                token.write(creds.to_json())
+            _save_token(creds)
         return creds
 
+    def _execute(self, request: Any, write: bool = False) -> Dict[str, Any]:
+        """Execute a googleapiclient request, backing off on 429/503 responses.
+
+        Writes also wait on the shared write-quota bucket before each attempt.
+        """
+
+        http_error = _google_api().HttpError
+        attempt = 0
+        while True:
+            if write:
+                self._write_bucket.wait()
+            try:
+                return request.execute(http=self._thread_http())
+            except http_error as exc:
+                if exc.resp.status not in RETRY_STATUSES or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_retry_delay(attempt, exc.resp.get("retry-after")))
+                attempt += 1
+
     def _ensure_sheet(self) -> None:
-        """Create the internships sheet if it does not already exist."""
+        """Create the internships sheet if it does not already exist.
 
-        sheets = self.service.spreadsheets().get(spreadsheetId=self.spreadsheet_id).execute()
+        A marker file per spreadsheet records a successful check so later runs
+        skip the lookup; set ``TRACKER_FORCE_SHEET_CHECK=1`` to check again.
+        """
+
+        marker = CACHE_DIR / f"sheet_ready_{hashlib.sha1(self.spreadsheet_id.encode()).hexdigest()}"
+        if not TRACKER_FORCE_SHEET_CHECK and marker.exists():
+            self._sheet_ready = True
+            return
+        request = self.service.spreadsheets().get(spreadsheetId=self.spreadsheet_id, fields="sheets(properties(title))")
+        sheets = self._execute(request)
         titles = [sheet["properties"]["title"] for sheet in sheets["sheets"]]
         if SHEET_NAME not in titles:
             body = {"requests": [{"addSheet": {"properties": {"title": SHEET_NAME}}}]}
-            self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body=body).execute()
+            request = self.service.spreadsheets().batchUpdate(spreadsheetId=self.spreadsheet_id, body=body)
+            self._execute(request, write=True)
             self.append_rows([COLUMNS])
+        self._sheet_ready = True
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _as_values(rows: Iterable[Iterable[str]]) -> List[List[str]]:
+        """Return ``rows`` as a list of lists, copying only when it is not one already."""
+
+        if isinstance(rows, list) and (not rows or isinstance(rows[0], list)):
+            return rows
+        return [list(row) for row in rows]
+
+    def _request_headers(self) -> Dict[str, str]:
+        """Return the JSON and bearer headers for the current access token."""
+
+        return {"Authorization": f"Bearer {self.creds.token}", "Content-Type": "application/json"}
+
+    def _http_client(self) -> httpx.Client:
+        """Return this tracker's httpx client, opening it on first use."""
+
+        if self._client is None:
+            self._client = _httpx().Client(http2=_http2_supported(), timeout=30)
+        return self._client
+
+    def _append_url(self) -> str:
+        """Return the REST ``values:append`` URL for the internships sheet."""
+
+        return f"{SHEETS_API_URL}/{self.spreadsheet_id}/values/{SHEET_NAME}!A1:append"
+
+    def _post(self, url: str, body: Dict[str, Any], params: Dict[str, str] | None = None) -> Dict[str, Any]:
+        """POST ``body`` to the Sheets REST API.
+
+        The token is refreshed once on a 401 and 429/503 responses are retried
+        with backoff; every attempt waits on the shared write-quota bucket.
+        """
+
+        client = self._http_client()
+        content = _dumps(body)
+        if not self.creds.valid:
+            self.creds.refresh(_google_api().Request())
+        refreshed = False
+        attempt = 0
+        while True:
+            self._write_bucket.wait()
+            response = client.post(url, params=params, content=content, headers=self._request_headers())
+            if response.status_code == 401 and not refreshed:
+                self.creds.refresh(_google_api().Request())
+                refreshed = True
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                time.sleep(_retry_delay(attempt, response.headers.get("retry-after")))
+                attempt += 1
+                continue
+            break
+        response.raise_for_status()
+        return orjson.loads(response.content) if orjson is not None else response.json()
 
     def append_rows(self, rows: Iterable[Iterable[str]]) -> None:
-        """Append raw rows to the internships sheet."""
+        """Append raw rows to the internships sheet in a single ``values.append`` call.
+
+        Rows go straight to the REST API over httpx (HTTP/2 when ``h2`` is
+        installed); without httpx the googleapiclient service is used.
+        """
 
-        values = [list(row) for row in rows]
+        values = self._as_values(rows)
+        if not values:
+            return
         body = {"values": values}
-        self.service.spreadsheets().values().append(
-            spreadsheetId=self.spreadsheet_id,
-            range=f"{SHEET_NAME}!A1",
-            valueInputOption="RAW",
-            body=body,
-        ).execute()
-
-    def add_job(self, job: Dict[str, str]) -> None:
-        """Write a job posting to Sheets using the configured schema."""
-
-        row = [
-            datetime.utcnow().isoformat(),
-            job.get("company", ""),
-            job.get("role", ""),
-            job.get("location", ""),
-            job.get("deadline", ""),
-            job.get("apply_link", ""),
-            job.get("source", ""),
-            "new",
-            job.get("resume_file", ""),
-            job.get("cover_letter_file", ""),
-            job.get("notes", ""),
-        ]
-        self.append_rows([row])
+        if _httpx() is not None:
+            self._post(self._append_url(), body, params={"valueInputOption": "RAW"})
+        else:
+            request = self.service.spreadsheets().values().append(
+                spreadsheetId=self.spreadsheet_id,
+                range=f"{SHEET_NAME}!A1",
+                valueInputOption="RAW",
+                body=body,
+            )
+            self._execute(request, write=True)
+
+    async def _access_token(self) -> str:
+        """Return a valid OAuth access token, refreshing it off the event loop if needed."""
+
+        import asyncio
+
+        if not self.creds.valid:
+            await asyncio.to_thread(self.creds.refresh, _google_api().Request())
+        return self.creds.token
+
+    async def _write_async(
+        self,
+        client: httpx.AsyncClient,
+        refresh_lock: asyncio.Lock,
+        values: List[List[str]],
+    ) -> None:
+        """POST one batch of rows to the ``values:append`` REST endpoint.
+
+        Retries follow :meth:`_post`: one token refresh on a 401, backoff on 429/503.
+        """
+
+        import asyncio
+
+        url = self._append_url()
+        params = {"valueInputOption": "RAW"}
+        content = _dumps({"values": values})
+        refreshed = False
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._write_bucket.reserve())
+            token = self.creds.token
+            response = await client.post(url, params=params, content=content, headers=self._request_headers())
+            if response.status_code == 401 and not refreshed:
+                async with refresh_lock:
+                    # Concurrent batches share one refresh
+                    if self.creds.token == token:
+                        await asyncio.to_thread(self.creds.refresh, _google_api().Request())
+                refreshed = True
+                continue
+            if response.status_code in RETRY_STATUSES and attempt < MAX_ATTEMPTS - 1:
+                await asyncio.sleep(_retry_delay(attempt, response.headers.get("retry-after")))
+                attempt += 1
+                continue
+            break
+        response.raise_for_status()
+
+    async def _append_batches_async(self, values: List[List[str]]) -> List[BaseException | None]:
+        """Send ``values`` as concurrent ``APPEND_BATCH_SIZE`` batches.
+
+        Returns one entry per batch: ``None`` if it was written, otherwise the
+        error it failed with. Every batch runs to completion before the client
+        is closed, even when a sibling fails.
+        """
+
+        import asyncio
+
+        httpx = _httpx()
+        if httpx is None:
+            raise ModuleNotFoundError("httpx is required for asynchronous Sheets writes")
+        await self._access_token()
+        refresh_lock = asyncio.Lock()
+        async with httpx.AsyncClient(http2=_http2_supported(), timeout=30) as client:
+            return await asyncio.gather(
+                *(
+                    self._write_async(client, refresh_lock, values[offset:offset + APPEND_BATCH_SIZE])
+                    for offset in range(0, len(values), APPEND_BATCH_SIZE)
+                ),
+                return_exceptions=True,
+            )
+
+    async def append_rows_async(self, rows: Iterable[Iterable[str]]) -> None:
+        """Append raw rows over HTTP, sending ``APPEND_BATCH_SIZE`` batches concurrently.
+
+        Batches are appended in whatever order the API processes them, so row
+        order is only preserved within a batch. If any batch fails, the first
+        error is raised once the others have finished.
+        """
+
+        values = self._as_values(rows)
+        if not values:
+            return
+        for error in await self._append_batches_async(values):
+            if error is not None:
+                raise error
+
+    @staticmethod
+    def _job_row(job: Job | Dict[str, str], added_at: str) -> List[str]:
+        """Lay out a job posting as a row matching ``COLUMNS``."""
+
+        if isinstance(job, Job):
+            return [
+                added_at,
+                job.company,
+                job.role,
+                job.location,
+                job.deadline,
+                job.apply_link,
+                job.source,
+                "new",
+                job.resume_file,
+                job.cover_letter_file,
+                job.notes,
+            ]
+        try:
+            values = _get_row_values(job)
+        except KeyError:
+            # Only visit the keys the posting actually has
+            row = _ROW_TEMPLATE.copy()
+            row[0] = added_at
+            for key, value in job.items():
+                index = _FIELD_IDX.get(key)
+                if index is not None:
+                    row[index] = value
+            return row
+        return [added_at, *values[:6], "new", *values[6:]]
+
+    def add_job(self, job: Job | Dict[str, str], now_iso: str | None = None) -> None:
+        """Queue a job posting for Sheets using the configured schema.
+
+        ``now_iso`` lets callers stamp several jobs with one shared timestamp.
+        The row is written once ``SHEETS_FLUSH`` rows are pending, on
+        :meth:`flush`, or when the tracker's ``with`` block exits.
+        """
+
+        if now_iso is None:
+            now_iso = _utc_now_iso()
+        self._pending.append(self._job_row(job, now_iso))
+        self._maybe_flush()
+
+    def add_jobs(self, jobs: Iterable[Job | Dict[str, str]]) -> int:
+        """Write many job postings using one append call per ``APPEND_BATCH_SIZE`` rows.
+
+        Returns the number of jobs written.
+        """
+
+        added_at = _utc_now_iso()
+        rows = [self._job_row(job, added_at) for job in jobs]
+        self._pending.extend(rows)
+        self.flush()
+        return len(rows)
+
+    def _maybe_flush(self) -> None:
+        """Flush once the buffer reaches the configured threshold."""
+
+        if len(self._pending) >= self._flush_threshold:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered rows, one append call per ``APPEND_BATCH_SIZE`` rows.
+
+        Rows stay buffered until their batch has been written, so a failed call
+        can be retried by flushing again.
+        """
+
+        while self._pending:
+            self.append_rows(self._pending[:APPEND_BATCH_SIZE])
+            del self._pending[:APPEND_BATCH_SIZE]
+
+    async def flush_async(self) -> None:
+        """Asynchronous :meth:`flush` that writes the buffered batches concurrently.
+
+        Each batch is removed from the buffer once written; rows from failed
+        batches stay buffered and the first error is raised.
+        """
+
+        if not self._pending:
+            return
+        pending = self._pending[:]
+        results = await self._append_batches_async(pending)
+        failed: List[List[str]] = []
+        for offset, error in zip(range(0, len(pending), APPEND_BATCH_SIZE), results):
+            if error is not None:
+                failed.extend(pending[offset:offset + APPEND_BATCH_SIZE])
+        # Rows queued while the batches were in flight stay behind the failed ones
+        self._pending[:len(pending)] = failed
+        for error in results:
+            if error is not None:
+                raise error
+
+    async def add_jobs_async(self, jobs: Iterable[Job | Dict[str, str]]) -> int:
+        """Asynchronous :meth:`add_jobs` that writes its batches concurrently.
+
+        Returns the number of jobs written.
+        """
+
+        added_at = _utc_now_iso()
+        rows = [self._job_row(job, added_at) for job in jobs]
+        self._pending.extend(rows)
+        await self.flush_async()
+        return len(rows)
+
+    def __enter__(self) -> SheetsTracker:
+        """Return the tracker for use in a ``with`` block."""
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Write any rows still buffered when the block exits, then close the HTTP client."""
+
+        try:
+            self.flush()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the httpx client used for writes, if one was opened."""
+
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
 
 __all__ = ["SheetsTracker"]
@@ -0,0 +1,250 @@
+import random
+from dataclasses import asdict
+
+import pytest
+
+from src.sources import rss_client
+from src.tracker.schema import Job
+
+FRAGMENTS = [
+    "Location: ",
+    "Based in: ",
+    "Office: ",
+    "Apply by: ",
+    "Deadline: ",
+    "Applications close: ",
+    "Remote",
+    "Work from home",
+    "WFH",
+    "Boston",
+    "Austin, TX",
+    "Paris, France",
+    "New York",
+    "March 1",
+    "2026-05-01",
+    ", ",
+    ": ",
+    " ",
+    "\n",
+    "MA",
+    "intern",
+]
+
+
+def _sequential_search(text):
+    """Each field's patterns searched one after another over the whole text."""
+
+    found = {}
+    for field, patterns in (("location", rss_client.LOCATION_PATTERNS), ("deadline", rss_client.DEADLINE_PATTERNS)):
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                found[field] = (match.group(1) if pattern.groups else match.group(0)).strip()
+                break
+    return found
+
+
+def _extracted(entry):
+    """Return the non-empty location/deadline fields of the job built from ``entry``."""
+
+    job = rss_client._create_job_record({"title": "Intern", "link": "https://example.com", **entry}, "feed")
+    return {field: value for field, value in (("location", job.location), ("deadline", job.deadline)) if value}
+
+
+def test_extraction_matches_sequential_search(monkeypatch):
+    monkeypatch.setattr(rss_client, "_parse_deadline", lambda text: text)
+    rng = random.Random(1234)
+    for _ in range(5000):
+        text = "".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 12)))
+        expected = {field: value for field, value in _sequential_search(text).items() if value}
+        assert _extracted({"summary": text}) == expected, text
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Deadline: Remote, Location: Boston", {"deadline": "Remote", "location": "Boston"}),
+        ("Apply by: Austin, TX", {"deadline": "Austin", "location": "Austin, TX"}),
+        ("Location: Deadline: soon", {"deadline": "soon", "location": "Deadline: soon"}),
+        # Higher-priority patterns win even when they appear later in the text
+        ("Austin, TX then Office: HQ", {"location": "HQ"}),
+        ("Applications close: June 1\nApply by: May 1", {"deadline": "May 1"}),
+    ],
+)
+def test_extraction_field_priority(text, expected, monkeypatch):
+    monkeypatch.setattr(rss_client, "_parse_deadline", lambda text: text)
+    assert _extracted({"summary": text}) == expected == _sequential_search(text)
+
+
+def test_extraction_reads_description_after_summary():
+    assert _extracted({"summary": "Great role", "description": "Location: Denver"}) == {"location": "Denver"}
+    assert _extracted({"summary": "Office: HQ", "description": "Location: Denver"}) == {"location": "Denver"}
+
+
+RSS = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Jobs</title>
+<item><title>Intern 1</title><link>https://example.com/1</link><guid>1</guid>
+<description>Location: Boston</description></item>
+</channel></rss>"""
+
+
+class _Response:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = "https://example.com/feed"
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class _Session:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        return self.responses.pop(0)
+
+
+def test_not_modified_feed_reuses_cached_jobs(tmp_path, monkeypatch):
+    session = _Session([_Response(200, RSS, {"ETag": '"v1"'}), _Response(304)])
+    monkeypatch.setattr(rss_client, "get_session", lambda: session)
+    cache_path = tmp_path / "rss_cache.json"
+
+    first = rss_client.parse_feeds(["https://example.com/feed"], cache_path)
+    second = rss_client.parse_feeds(["https://example.com/feed"], cache_path)
+
+    assert [job.role for job in first] == ["Intern 1"]
+    assert first[0].location == "Boston"
+    assert second == first
+    assert isinstance(second[0], Job)
+    assert session.requests == [{}, {"If-None-Match": '"v1"'}]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("2027-03-01", "2027-03-01"),
+        ("03/01/2027", "2027-03-01"),
+        ("March 1 2027", "2027-03-01"),
+        # Incomplete or non-dates are kept verbatim rather than completed with guesses
+        ("March 1", "March 1"),
+        ("5 positions open", "5 positions open"),
+        ("Friday", "Friday"),
+        ("Q3 2026", "Q3 2026"),
+        ("end of May", "end of May"),
+    ],
+)
+def test_parse_deadline(text, expected):
+    assert rss_client._parse_deadline(text) == expected
+
+
+@pytest.mark.parametrize(
+    ("summary", "expected"),
+    [
+        ("Apply by: March 1, 2027", "March 1"),
+        ("Deadline: 5 positions open", "5 positions open"),
+        ("Deadline: Friday", "Friday"),
+        ("Applications close: Q3 2026", "Q3 2026"),
+        ("Apply by: 2027-03-01", "2027-03-01"),
+    ],
+)
+def test_extract_deadline_keeps_unparseable_text(summary, expected):
+    assert rss_client._create_job_record({"summary": summary}, "feed").deadline == expected
+
+
+def _feed(*ids, without_link=()):
+    items = "".join(
+        f"<item><title>Intern {i}</title>"
+        + ("" if i in without_link else f"<link>https://example.com/{i}</link>")
+        + f"<guid>{i}</guid></item>"
+        for i in ids
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+
+
+def _run_twice(tmp_path, monkeypatch, first_feed, second_feed):
+    session = _Session([_Response(200, first_feed), _Response(200, second_feed)])
+    monkeypatch.setattr(rss_client, "get_session", lambda: session)
+    cache_path = tmp_path / "rss_cache.json"
+    rss_client.parse_feeds(["https://example.com/feed"], cache_path)
+
+    processed = []
+    create_job_record = rss_client._create_job_record
+
+    def counting_create(entry, feed_url):
+        processed.append(entry["title"])
+        return create_job_record(entry, feed_url)
+
+    monkeypatch.setattr(rss_client, "_create_job_record", counting_create)
+    jobs = rss_client.parse_feeds(["https://example.com/feed"], cache_path)
+    return [job.role for job in jobs], processed
+
+
+@pytest.mark.parametrize(
+    ("first", "second", "expected", "processed"),
+    [
+        # Oldest-first feed gaining entries at the end
+        ((1, 2, 3), (1, 2, 3, 4, 5), [1, 2, 3, 4, 5], [4, 5]),
+        # Newest-first feed gaining entries at the start
+        ((3, 2, 1), (5, 4, 3, 2, 1), [5, 4, 3, 2, 1], [5, 4]),
+        # Entries that left the feed do not come back from the cache
+        ((1, 2, 3), (2, 3, 4), [2, 3, 4], [4]),
+    ],
+)
+def test_only_new_entries_are_processed(tmp_path, monkeypatch, first, second, expected, processed):
+    roles, seen = _run_twice(tmp_path, monkeypatch, _feed(*first), _feed(*second))
+    assert roles == [f"Intern {i}" for i in expected]
+    assert seen == [f"Intern {i}" for i in processed]
+
+
+def test_skipped_entries_do_not_shift_cached_jobs(tmp_path, monkeypatch):
+    roles, seen = _run_twice(
+        tmp_path,
+        monkeypatch,
+        _feed(1, 2, 3, without_link=(2,)),
+        _feed(1, 2, 3, 4, without_link=(2,)),
+    )
+    assert roles == ["Intern 1", "Intern 3", "Intern 4"]
+    assert seen == ["Intern 4"]
+
+
+RSS2 = b"""<?xml version="1.0"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Jobs</title><link>https://example.com</link><description>d</description>
+<item><title>Backend Intern</title><link>https://example.com/1</link><dc:creator>Acme</dc:creator>
+<description>Location: Boston, MA. Apply by: 2027-03-01</description><guid>1</guid><category>Remote</category></item>
+<item><title>Data Intern</title><link>https://example.com/2</link><author>jobs@globex.com (Globex)</author>
+<description>Based in Austin, TX</description><content:encoded>Deadline: March 5, 2027</content:encoded></item>
+</channel></rss>"""
+
+RSS1 = b"""<?xml version="1.0"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel rdf:about="https://example.com"><title>Jobs</title><link>https://example.com</link><description>d</description></channel>
+<item rdf:about="https://example.com/3"><title>ML Intern</title><link>https://example.com/3</link><dc:creator>Initech</dc:creator>
+<description>Office: Seattle. Applications close 2027-01-15</description></item>
+</rdf:RDF>"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Jobs</title><id>urn:feed</id><updated>2026-01-01T00:00:00Z</updated>
+<entry><title>Platform Intern</title><link rel="alternate" href="https://example.com/4"/><id>urn:4</id><updated>2026-01-01T00:00:00Z</updated>
+<author><name>Umbrella</name></author><summary>Location: Remote</summary><category term="engineering"/></entry>
+<entry><title>Web Intern</title><link href="https://example.com/5"/><id>urn:5</id><updated>2026-01-01T00:00:00Z</updated>
+<author><name>Hooli</name></author><content type="html">&lt;b&gt;Office: NYC&lt;/b&gt;</content></entry>
+<entry><title>Text Intern</title><link href="https://example.com/6"/><id>urn:6</id><updated>2026-01-01T00:00:00Z</updated>
+<content type="text">Location: Denver, CO. Deadline: 2027-02-02</content></entry>
+</feed>"""
+
+
+@pytest.mark.parametrize("xml", [RSS2, RSS1, ATOM], ids=["rss2", "rss1", "atom"])
+def test_fast_parse_matches_feedparser(xml):
+    feedparser = pytest.importorskip("feedparser")
+    pytest.importorskip("lxml")
+
+    fast = [asdict(rss_client._create_job_record(entry, "feed")) for entry in rss_client._fast_parse(xml)]
+    slow = [asdict(rss_client._create_job_record(entry, "feed")) for entry in feedparser.parse(xml).entries]
+    assert fast == slow
@@ -0,0 +1,254 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+httpx = pytest.importorskip("httpx")
+
+from src.tracker import sheets_client
+from src.tracker.schema import COLUMNS, Job
+from src.tracker.sheets_client import SheetsTracker
+
+
+class _Creds:
+    token = "token"
+    valid = True
+
+    def refresh(self, request):
+        self.token = "refreshed"
+
+
+@pytest.fixture
+def make_tracker(monkeypatch):
+    monkeypatch.setattr(SheetsTracker, "_auth", lambda self: _Creds())
+    monkeypatch.setattr(SheetsTracker, "_get_service", classmethod(lambda cls, creds: None))
+    monkeypatch.setattr(SheetsTracker, "_ensure_sheet", lambda self: None)
+    monkeypatch.setattr(sheets_client, "_retry_delay", lambda attempt, retry_after: 0.0)
+    monkeypatch.setattr(SheetsTracker, "_write_bucket", sheets_client._TokenBucket(10_000))
+
+    def make(handler, flush_threshold=3):
+        tracker = SheetsTracker("sheet-id")
+        tracker._flush_threshold = flush_threshold
+        tracker._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return tracker
+
+    return make
+
+
+def _recorder(requests):
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={})
+
+    return handler
+
+
+def test_job_row_matches_columns():
+    job = {key: key for key in COLUMNS if key not in ("added_at", "status")}
+    row = SheetsTracker._job_row(job, "2026-01-01T00:00:00")
+    assert row == ["2026-01-01T00:00:00" if key == "added_at" else "new" if key == "status" else key for key in COLUMNS]
+    assert SheetsTracker._job_row(Job.from_dict(job), "2026-01-01T00:00:00") == row
+    partial = SheetsTracker._job_row({"company": "Acme", "unknown": "x"}, "t")
+    assert partial == ["t", "Acme", "", "", "", "", "", "new", "", "", ""]
+
+
+def test_add_job_buffers_until_threshold(make_tracker):
+    requests = []
+    tracker = make_tracker(_recorder(requests))
+    tracker.add_job({"company": "A"}, now_iso="t")
+    tracker.add_job({"company": "B"}, now_iso="t")
+    assert requests == []
+
+    tracker.add_job({"company": "C"}, now_iso="t")
+    assert len(requests) == 1
+    request = requests[0]
+    assert request.url.path == "/v4/spreadsheets/sheet-id/values/Internships!A1:append"
+    assert request.url.params["valueInputOption"] == "RAW"
+    assert [row[1] for row in json.loads(request.content)["values"]] == ["A", "B", "C"]
+    assert tracker._pending == []
+
+
+def test_context_manager_flushes_remaining_rows(make_tracker):
+    requests = []
+    with make_tracker(_recorder(requests)) as tracker:
+        tracker.add_job({"company": "A"})
+    assert len(requests) == 1
+    assert tracker._client is None
+
+
+def test_discarding_tracker_with_pending_rows_warns(make_tracker, caplog):
+    import gc
+
+    tracker = make_tracker(_recorder([]))
+    tracker.add_job({"company": "A"})
+    del tracker
+    gc.collect()
+    assert "discarded with 1 unwritten rows" in caplog.text
+
+    caplog.clear()
+    with make_tracker(_recorder([])) as tracker:
+        tracker.add_job({"company": "A"})
+    del tracker
+    gc.collect()
+    assert "unwritten" not in caplog.text
+
+
+def test_add_jobs_appends_in_batches(make_tracker, monkeypatch):
+    monkeypatch.setattr(sheets_client, "APPEND_BATCH_SIZE", 2)
+    requests = []
+    tracker = make_tracker(_recorder(requests))
+    assert tracker.add_jobs([Job(company=str(i)) for i in range(5)]) == 5
+    batches = [[row[1] for row in json.loads(request.content)["values"]] for request in requests]
+    assert batches == [["0", "1"], ["2", "3"], ["4"]]
+
+
+def test_failed_flush_keeps_rows_buffered(make_tracker):
+    tracker = make_tracker(lambda request: httpx.Response(400))
+    tracker.add_job({"company": "A"})
+    with pytest.raises(httpx.HTTPStatusError):
+        tracker.flush()
+    assert len(tracker._pending) == 1
+
+
+def _mock_async_client(monkeypatch, handler):
+    transport = httpx.MockTransport(handler)
+    async_httpx = SimpleNamespace(AsyncClient=lambda **kwargs: httpx.AsyncClient(transport=transport))
+    monkeypatch.setattr(sheets_client, "_httpx", lambda: async_httpx)
+
+
+def _companies(request):
+    return [row[1] for row in json.loads(request.content)["values"]]
+
+
+def test_append_rows_async_waits_for_every_batch_before_raising(make_tracker, monkeypatch):
+    monkeypatch.setattr(sheets_client, "APPEND_BATCH_SIZE", 1)
+    written = []
+
+    async def handler(request):
+        if _companies(request) == ["bad"]:
+            return httpx.Response(400)
+        await asyncio.sleep(0.01)
+        written.extend(_companies(request))
+        return httpx.Response(200, json={})
+
+    _mock_async_client(monkeypatch, handler)
+    tracker = make_tracker(_recorder([]))
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(tracker.append_rows_async([["t", "a"], ["t", "bad"], ["t", "b"]]))
+    assert sorted(written) == ["a", "b"]
+
+
+def test_flush_async_keeps_only_failed_batches(make_tracker, monkeypatch):
+    monkeypatch.setattr(sheets_client, "APPEND_BATCH_SIZE", 2)
+    batches = []
+
+    def handler(request):
+        batches.append(_companies(request))
+        return httpx.Response(503 if "2" in batches[-1] else 200, json={})
+
+    _mock_async_client(monkeypatch, handler)
+    tracker = make_tracker(_recorder([]), flush_threshold=100)
+    for i in range(5):
+        tracker.add_job({"company": str(i)}, now_iso="t")
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(tracker.flush_async())
+    assert [row[1] for row in tracker._pending] == ["2", "3"]
+    assert ["0", "1"] in batches and ["4"] in batches
+
+    batches.clear()
+    _mock_async_client(monkeypatch, _recorder(batches))
+    asyncio.run(tracker.flush_async())
+    assert [_companies(request) for request in batches] == [["2", "3"]]
+    assert tracker._pending == []
+
+
+def test_thread_http_is_shared_per_thread_and_token(make_tracker):
+    import threading
+
+    from google.oauth2.credentials import Credentials
+
+    first = make_tracker(_recorder([]))
+    second = make_tracker(_recorder([]))
+    first.creds = Credentials(token="shared-token")
+    second.creds = Credentials(token="shared-token")
+
+    http = first._thread_http()
+    assert second._thread_http() is http
+    assert http.http.timeout == 60
+
+    other_thread = []
+    worker = threading.Thread(target=lambda: other_thread.append(first._thread_http()))
+    worker.start()
+    worker.join()
+    assert other_thread[0] is not http
+
+
+def test_post_retries_rate_limits_and_refreshes_once(make_tracker, monkeypatch):
+    delays = []
+    monkeypatch.setattr(sheets_client, "_retry_delay", lambda attempt, retry_after: delays.append(retry_after) or 0.0)
+    responses = [
+        httpx.Response(401),
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"ok": True}),
+    ]
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.headers["Authorization"])
+        return responses.pop(0)
+
+    tracker = make_tracker(handler)
+    assert tracker._post("https://sheets.test/append", {"values": []}) == {"ok": True}
+    assert tokens == ["Bearer token"] + ["Bearer refreshed"] * 3
+    assert delays == ["7", None]
+
+
+def test_post_gives_up_after_max_attempts(make_tracker):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429)
+
+    tracker = make_tracker(handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        tracker._post("https://sheets.test/append", {"values": []})
+    assert len(calls) == sheets_client.MAX_ATTEMPTS
+
+
+def test_execute_retries_http_errors(make_tracker):
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    class Request:
+        def __init__(self, statuses):
+            self.statuses = list(statuses)
+
+        def execute(self, http=None):
+            status = self.statuses.pop(0)
+            if status != 200:
+                raise HttpError(httplib2.Response({"status": status}), b"")
+            return {"ok": True}
+
+    tracker = make_tracker(_recorder([]))
+    tracker.creds = None
+    tracker._thread_http = lambda: None
+    assert tracker._execute(Request([429, 503, 200]), write=True) == {"ok": True}
+    with pytest.raises(HttpError):
+        tracker._execute(Request([400, 200]))
+
+
+def test_retry_delay_prefers_numeric_retry_after():
+    assert sheets_client._retry_delay(0, "12") == 12.0
+    assert 1.0 <= sheets_client._retry_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") < 2.0
+    assert sheets_client._retry_delay(10, None) == sheets_client.MAX_BACKOFF
+
+
+def test_token_bucket_delays_once_burst_is_spent():
+    bucket = sheets_client._TokenBucket(2, period=1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.05)
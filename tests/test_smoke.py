@@ -1,8 +1,17 @@
-import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
 
 MODULES = [
     "config",
     "main",
+    "sources.session",
     "sources.simplify_client",
     "sources.rss_client",
     "tracker.sheets_client",
@@ -14,6 +23,21 @@ MODULES = [
 ]
 
 
-def test_imports():
-    for module in MODULES:
-        importlib.import_module(module)
+# Cumulative import time allowed per module, in milliseconds
+IMPORT_BUDGET_MS = int(os.getenv("IMPORT_BUDGET_MS", "200"))
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import(module):
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(ROOT), str(SRC)])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    timings = [line for line in result.stderr.splitlines() if line.startswith("import time:")]
+    cumulative_us = int(timings[-1].split("|")[1])
+    assert cumulative_us < IMPORT_BUDGET_MS * 1000, f"{module} took {cumulative_us / 1000:.0f} ms to import"